@@ -8,6 +8,14 @@ from typing import Dict, List, Any
 from datetime import datetime
 
 class RiskScorer:
+    # Compiled once; re.findall with flags recompiled these on every call
+    _TIME_PATTERNS = {
+        "immediate": re.compile(r'\b(immediately|now|urgent|asap)\b', re.IGNORECASE),
+        "short_term": re.compile(r'\b(soon|shortly|coming weeks|next month)\b', re.IGNORECASE),
+        "medium_term": re.compile(r'\b(Q[1-4]\s*\d{4}|next quarter|this year)\b', re.IGNORECASE),
+        "long_term": re.compile(r'\b(long.?term|future|beyond|subsequent)\b', re.IGNORECASE)
+    }
+
     def __init__(self):
         self.risk_weights = {
             "credit_risk": 0.35,
@@ -220,19 +228,10 @@ class RiskScorer:
     def _analyze_temporal_urgency(self, text: str) -> Dict[str, Any]:
         """Analyze temporal urgency of risks"""
         text_lower = text.lower()
-        
-        # Extract time references
-        time_patterns = {
-            "immediate": r'\b(immediately|now|urgent|asap)\b',
-            "short_term": r'\b(soon|shortly|coming weeks|next month)\b',
-            "medium_term": r'\b(Q[1-4]\s*\d{4}|next quarter|this year)\b',
-            "long_term": r'\b(long.?term|future|beyond|subsequent)\b'
-        }
-        
+
         urgency_scores = {}
-        for timeframe, pattern in time_patterns.items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            urgency_scores[timeframe] = len(matches)
+        for timeframe, pattern in self._TIME_PATTERNS.items():
+            urgency_scores[timeframe] = sum(1 for _ in pattern.finditer(text_lower))
         
         # Calculate overall urgency
         total_references = sum(urgency_scores.values())
@@ -284,23 +283,17 @@ class RiskScorer:
                             financial: Dict, financial_data: Dict) -> Dict[str, Any]:
         """Combine all risk factors with real data enhancement"""
         category_scores = {}
-        
+
+        # The intensity/temporal/financial bonuses don't depend on the
+        # category, so compute the combined multiplier once
+        intensity_bonus = sum(intensity.values()) / len(intensity) * 0.2
+        temporal_bonus = temporal["overall_urgency"] * 0.15
+        financial_bonus = financial["impact_score"] * 0.25
+        data_boost = 0.1 if financial_data else 0
+        multiplier = 1 + intensity_bonus + temporal_bonus + financial_bonus + data_boost
+
         for risk_type, base_score in base_scores.items():
-            # Apply intensity modifiers
-            intensity_bonus = sum(intensity.values()) / len(intensity) * 0.2
-            
-            # Apply temporal urgency
-            temporal_bonus = temporal["overall_urgency"] * 0.15
-            
-            # Apply financial impact
-            financial_bonus = financial["impact_score"] * 0.25
-            
-            # Real data confidence boost
-            data_boost = 0.1 if financial_data else 0
-            
-            # Calculate final category score
-            final_score = base_score * (1 + intensity_bonus + temporal_bonus + financial_bonus + data_boost)
-            category_scores[risk_type] = min(round(final_score, 1), 100)
+            category_scores[risk_type] = min(round(base_score * multiplier, 1), 100)
         
         # Calculate overall risk score
         overall_score = 0
@@ -1,12 +1,22 @@
 """
 Universal content fetcher for URLs and documents - PRODUCTION READY
 """
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from bs4 import BeautifulSoup, NavigableString, Tag
 from typing import Dict, Optional, List, Tuple
 import re
+import tempfile
+import threading
 import time
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlparse, urljoin
 import logging
 from datetime import datetime
@@ -16,84 +26,267 @@ import os
 import io
 import ipaddress
 
+# Optional: pyahocorasick finds every content-type indicator in one pass
+# over the document instead of one substring scan per term
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# PyMuPDF extracts text natively in C, an order of magnitude faster than
+# pdfplumber's pure-Python pdfminer backend; pdfplumber stays the fallback
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# Prefer the C-based lxml backend; html.parser is pure Python and several
+# times slower on large news pages
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
+# Boilerplate fragments stripped from every extracted page. Kept as a
+# tuple so both the fused-regex fallback and the optional Hyperscan
+# database below compile from the same source list.
+_BOILERPLATE_PATTERNS = (
+    r'Privacy Policy',
+    r'Terms of Service',
+    r'Cookie Policy',
+    r'Sign up.*?newsletter',
+    r'Subscribe',
+    r'Follow us',
+    r'Copyright.*?\d{4}',
+    r'All rights reserved',
+    r'Loading\.\.\.',
+    r'Please enable JavaScript',
+    r'ADVERTISEMENT',
+    r'Sponsored Content',
+)
+
+# Hyperscan scans all patterns in one compiled-DFA pass and is much
+# faster than re on multi-pattern sweeps; fall back to the fused regex
+# when it is not installed or the pattern set fails to compile
+try:
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[p.encode() for p in _BOILERPLATE_PATTERNS],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+        * len(_BOILERPLATE_PATTERNS),
+    )
+except Exception:
+    _HS_DB = None
+
+_WORD_RE = re.compile(r'\S+')
+
+def _word_count(text: str) -> int:
+    """Count words without materializing the list text.split() builds"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+def _hyperscan_strip(text: str) -> str:
+    """Remove boilerplate spans found by the Hyperscan database"""
+    data = text.encode('utf-8')
+    spans = []
+    _HS_DB.scan(
+        data,
+        match_event_handler=lambda pat, start, end, flags, ctx: spans.append((start, end))
+    )
+    if not spans:
+        return text
+
+    # Splice out the (possibly overlapping) matched spans in one pass;
+    # matches are ASCII so the cuts stay on UTF-8 character boundaries
+    spans.sort()
+    pieces = []
+    pos = 0
+    for start, end in spans:
+        if start > pos:
+            pieces.append(data[pos:start])
+        if end > pos:
+            pos = end
+    pieces.append(data[pos:])
+    return b''.join(pieces).decode('utf-8')
+
+class _TokenBucket:
+    """Per-host token bucket that is safe for concurrent coroutines.
+
+    Tokens refill continuously at `rate` per second; acquire() reserves a
+    token (going negative under contention) and each waiter sleeps for
+    its own share, so bursts of coroutines cannot jointly exceed the cap
+    the way the shared last-request timestamp could.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = rate
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
 class ContentFetcher:
+    # Compiled once: the boilerplate list is fused into one alternation so
+    # cleaning scans the text a single time instead of once per pattern.
+    # The trailing lazy ".*?" quantifiers of the original list matched
+    # empty, so the equivalent literals are kept as-is.
+    _BOILERPLATE_RE = re.compile('|'.join(_BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+    # Security settings - shared constants, frozen so no per-instance copies
+    allowed_domains = frozenset(('sec.gov', 'reuters.com', 'bloomberg.com', 'ft.com'))
+    # Hosts must match on a registered-domain suffix: the old substring
+    # check let e.g. evil-sec.gov.attacker.com through
+    _ALLOWED_SUFFIX_RE = re.compile(
+        r'(?:^|\.)(?:sec\.gov|reuters\.com|bloomberg\.com|ft\.com)(?::\d+)?$')
+    max_file_size = 10 * 1024 * 1024  # 10MB limit
+    blocked_networks = ('127.0.0.0/8', '10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16')
+    # Parsed once; _validate_url used to rebuild these per call
+    _blocked_networks = tuple(ipaddress.ip_network(n, strict=False) for n in blocked_networks)
+    _DANGEROUS_EXTENSIONS = ('.exe', '.bat', '.sh', '.php', '.jar')
+    _STRIPPED_TAGS = frozenset((
+        'script', 'style', 'nav', 'header', 'footer', 'aside', 'meta',
+        'link', 'button', 'form'))
+    _EVENT_ATTRS = ('onclick', 'onload', 'onerror', 'onmouseover')
+
+    # Rate limiting - requests per second, per domain
+    rate_limits = MappingProxyType({
+        'sec.gov': 10,
+        'default': 2
+    })
+
+    headers = MappingProxyType({
+        'User-Agent': 'Financial Analysis Bot 1.0 (compatible; +http://example.com/bot)',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+
     def __init__(self, timeout: int = 30, max_retries: int = 3):
-        # Security settings - ADD THESE
-        self.allowed_domains = [
-            'sec.gov', 'reuters.com', 'bloomberg.com', 'ft.com'
-        ]
-        self.max_file_size = 10 * 1024 * 1024  # 10MB limit
-        self.blocked_networks = ['127.0.0.0/8', '10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16']
-        
-        # Rate limiting - ADD THESE
-        self.rate_limits = {
-            'sec.gov': 10,  # 10 requests per second
-            'default': 2    # 2 requests per second to others
-        }
         self.last_request_time = {}
-        
-        self.headers = {
-            'User-Agent': 'Financial Analysis Bot 1.0 (compatible; +http://example.com/bot)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
+        self._host_buckets = {}  # domain -> _TokenBucket (async path)
+
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         self.timeout = timeout
         self.max_retries = max_retries
+
+        # Pooled keep-alive connections per host with retry handled by
+        # urllib3: repeat fetches to sec.gov/reuters.com reuse the TLS
+        # session instead of re-handshaking every request
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"]
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Shared async client for the API path: keep-alive pool so the event
+        # loop keeps serving other requests while downloads are pending
+        self.async_client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+        )
         
+        # Parsed-result LRU with ETag/Last-Modified revalidation: repeat
+        # fetches of unchanged pages become 304s with no body or parse
+        # cost. A thread lock guards it so the sync path and the parse
+        # pool share it with the event loop (critical sections are dict
+        # lookups, far too short to stall the loop)
+        self._url_cache = OrderedDict()
+        self._url_cache_lock = threading.Lock()
+        self._url_cache_max = 256
+
+        # Hard cap for streamed downloads: large filings are truncated at
+        # this point instead of ballooning per-request memory
+        self.max_stream_bytes = 4 * 1024 * 1024
+
+        # Bounded pool for CPU-bound parsing (BeautifulSoup/PDF/docx) so
+        # concurrent downloads parse in parallel without unbounded threads
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix='content-parse')
+
         # Configure logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
     # 🔐 NEW SECURITY METHODS - ADD THESE
+    @lru_cache(maxsize=1024)
     def _validate_url(self, url: str) -> Dict[str, bool]:
-        """Validate URL for security risks"""
+        """Validate URL for security risks (memoized per URL)"""
         try:
             parsed = urlparse(url)
-            
+
             # Check if domain is allowed
-            domain_allowed = any(domain in parsed.netloc for domain in self.allowed_domains)
-            if not domain_allowed:
+            if not self._ALLOWED_SUFFIX_RE.search(parsed.netloc):
                 return {"valid": False, "error": f"Domain not allowed: {parsed.netloc}"}
-            
+
             # Check for internal IPs
             try:
                 ip = ipaddress.ip_address(parsed.hostname)
-                for network in self.blocked_networks:
-                    if ip in ipaddress.ip_network(network):
-                        return {"valid": False, "error": "Internal IP addresses not allowed"}
-            except:
+            except ValueError:
                 pass  # Not an IP address
+            else:
+                if any(ip in network for network in self._blocked_networks):
+                    return {"valid": False, "error": "Internal IP addresses not allowed"}
             
             # Check for dangerous file types
-            dangerous_extensions = ['.exe', '.bat', '.sh', '.php', '.jar']
-            if any(parsed.path.lower().endswith(ext) for ext in dangerous_extensions):
+            if parsed.path.lower().endswith(self._DANGEROUS_EXTENSIONS):
                 return {"valid": False, "error": "Dangerous file type"}
                 
             return {"valid": True}
         except Exception as e:
             return {"valid": False, "error": f"URL validation failed: {str(e)}"}
 
-    def _check_rate_limit(self, url: str):
-        """Enforce rate limiting"""
+    def _rate_limit_delay(self, url: str) -> float:
+        """Compute the delay needed to respect the per-domain rate limit"""
         domain = urlparse(url).netloc
         current_time = time.time()
-        
+
         limit = self.rate_limits.get(domain, self.rate_limits['default'])
-        
+
+        delay = 0.0
         if domain in self.last_request_time:
             time_since_last = current_time - self.last_request_time[domain]
             min_interval = 1.0 / limit
             if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                self.logger.info(f"Rate limiting: sleeping {sleep_time:.2f}s for {domain}")
-                time.sleep(sleep_time)
-        
-        self.last_request_time[domain] = time.time()
+                delay = min_interval - time_since_last
+                self.logger.info(f"Rate limiting: sleeping {delay:.2f}s for {domain}")
+
+        self.last_request_time[domain] = current_time + delay
+        return delay
+
+    def _check_rate_limit(self, url: str):
+        """Enforce rate limiting"""
+        delay = self._rate_limit_delay(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def _acquire_rate_slot(self, url: str):
+        """Await a rate-limit token for the URL's host"""
+        domain = urlparse(url).netloc
+        bucket = self._host_buckets.get(domain)
+        if bucket is None:
+            rate = self.rate_limits.get(domain, self.rate_limits['default'])
+            bucket = self._host_buckets.setdefault(domain, _TokenBucket(rate))
+        await bucket.acquire()
 
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to prevent path traversal"""
@@ -127,70 +320,250 @@ class ContentFetcher:
         # 🔐 SECURITY CHECK 2: Rate limiting
         self._check_rate_limit(url)
         
-        # 🔐 SECURITY CHECK 3: Size limit check
+        # No HEAD pre-check: the streaming GET below validates
+        # Content-Length and enforces the byte cap chunk by chunk, so the
+        # extra request only cost a round-trip plus TLS setup per fetch
+
+        # Revalidate any cached copy instead of re-downloading it
+        cached, conditional_headers = self._conditional_headers(url)
+
+        # Retries are handled by the urllib3 Retry policy mounted on the
+        # session, so a single attempt here is enough
         try:
-            head_response = self.session.head(url, timeout=5, allow_redirects=True)
-            content_length = head_response.headers.get('content-length')
+            self.logger.info(f"Fetching content from {url}")
+
+            response = self.session.get(url, timeout=self.timeout, stream=True,
+                                        headers=conditional_headers or None)
+            if cached and response.status_code == 304:
+                self.logger.info(f"Content unchanged for {url}, serving cached parse")
+                return cached[2]
+            response.raise_for_status()
+
+            # 🔐 SECURITY CHECK 4: Check actual content size
+            content_length = response.headers.get('content-length')
             if content_length and int(content_length) > self.max_file_size:
                 return {
-                    "status": "error", 
+                    "status": "error",
                     "error": f"File too large: {content_length} bytes",
                     "url": url,
                     "content": ""
                 }
-        except Exception as e:
-            self.logger.warning(f"HEAD request failed, continuing: {e}")
 
-        # Original retry logic with security
-        for attempt in range(self.max_retries):
-            try:
-                self.logger.info(f"Fetching content from {url} (attempt {attempt + 1})")
-                
-                response = self.session.get(url, timeout=self.timeout, stream=True)
-                response.raise_for_status()
-                
-                # 🔐 SECURITY CHECK 4: Check actual content size
-                content_length = response.headers.get('content-length')
-                if content_length and int(content_length) > self.max_file_size:
+            # Spool the body: small responses stay in RAM, anything past
+            # ~1 MB spills to a temp file, so peak memory per fetch stays
+            # bounded and the parsers read a file-like with no extra copy
+            buf = tempfile.SpooledTemporaryFile(max_size=1_000_000, mode='w+b')
+            total = 0
+            for chunk in response.iter_content(chunk_size=8192):
+                total += len(chunk)
+                if total > self.max_file_size:
+                    buf.close()
                     return {
-                        "status": "error", 
-                        "error": f"File too large: {content_length} bytes",
+                        "status": "error",
+                        "error": f"File exceeded size limit during download",
                         "url": url,
                         "content": ""
                     }
-                
-                # Read content with size limit
-                content_bytes = b""
-                for chunk in response.iter_content(chunk_size=8192):
-                    content_bytes += chunk
-                    if len(content_bytes) > self.max_file_size:
+                buf.write(chunk)
+            buf.seek(0)
+
+            # Handle different content types. The charset comes from the
+            # header alone: touching response.encoding/apparent_encoding
+            # can trigger a chardet scan over the whole body, while the
+            # HTML parser sniffs the <meta> declaration for free
+            content_type = response.headers.get('content-type', '')
+            try:
+                result = self._process_response_content(
+                    buf, content_type, url, self._header_charset(content_type))
+            finally:
+                buf.close()
+
+            if result.get("status") == "success":
+                self._cache_url_result(url, response, result)
+            return result
+
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Fetch failed for {url}: {e}")
+            return self._get_error_response(url, str(e))
+
+    async def fetch_url_content_async(self, url: str) -> Dict[str, str]:
+        """Async variant of fetch_url_content for the API event loop.
+
+        Network I/O goes through the shared httpx.AsyncClient so the loop
+        stays free to serve other requests while the download is pending.
+        """
+        # 🔐 SECURITY CHECK 1: Validate URL
+        validation = self._validate_url(url)
+        if not validation["valid"]:
+            return {
+                "status": "error",
+                "error": validation["error"],
+                "url": url,
+                "content": ""
+            }
+
+        # 🔐 SECURITY CHECK 2: Rate limiting (without blocking the loop)
+        await self._acquire_rate_slot(url)
+
+        # Revalidate any cached copy instead of re-downloading it
+        cached, conditional_headers = self._conditional_headers(url)
+
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.info(f"Fetching content from {url} (attempt {attempt + 1})")
+
+                # Stream the body in chunks with a hard byte cap so a
+                # 50 MB filing cannot balloon per-request memory
+                truncated = False
+                async with self.async_client.stream(
+                        "GET", url, headers=conditional_headers or None) as response:
+                    if cached and response.status_code == 304:
+                        self.logger.info(f"Content unchanged for {url}, serving cached parse")
+                        return cached[2]
+
+                    response.raise_for_status()
+
+                    # 🔐 SECURITY CHECK 3: Size limits
+                    content_length = response.headers.get('content-length')
+                    if content_length and int(content_length) > self.max_file_size:
                         return {
                             "status": "error",
-                            "error": f"File exceeded size limit during download",
+                            "error": f"File too large: {content_length} bytes",
                             "url": url,
                             "content": ""
                         }
-                
-                # Handle different content types
+
+                    buf = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        buf.extend(chunk)
+                        if len(buf) > self.max_stream_bytes:
+                            truncated = True
+                            self.logger.warning(
+                                f"Truncating {url} at {self.max_stream_bytes} bytes")
+                            break
+                    content_bytes = bytes(buf)
+
+                # Parsing (BeautifulSoup/pdfplumber/docx) is CPU-bound Python
+                # work; push it to the bounded parse pool so the loop stays
+                # free and parses overlap across in-flight downloads
                 content_type = response.headers.get('content-type', '')
-                
-                if 'application/pdf' in content_type:
-                    return self._handle_pdf_content(content_bytes, url)
-                elif 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' in content_type:
-                    return self._handle_docx_content(content_bytes, url)
-                elif 'text/html' in content_type:
-                    return self._handle_html_content(content_bytes, url, response.encoding)
-                else:
-                    return self._handle_plain_text(content_bytes, url, response.encoding)
-                    
-            except requests.exceptions.RequestException as e:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_pool, self._process_response_content,
+                    content_bytes, content_type, url, self._header_charset(content_type))
+
+                if truncated:
+                    result["truncated"] = True
+                elif result.get("status") == "success":
+                    # Truncated parses are never cached: a later 304 must
+                    # not pin a partial document
+                    self._cache_url_result(url, response, result)
+
+                return result
+
+            except httpx.HTTPError as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
                 if attempt == self.max_retries - 1:
                     return self._get_error_response(url, str(e))
-                time.sleep(2 ** attempt)  # Exponential backoff
-        
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
         return self._get_error_response(url, "Max retries exceeded")
 
+    async def fetch_many(self, urls: List[str]) -> List[Dict[str, str]]:
+        """Fetch several URLs concurrently over the shared client.
+
+        Batch latency collapses from the sum of the round-trips to
+        roughly the slowest one; per-URL errors come back as the usual
+        error dicts rather than raising out of the batch.
+        """
+        return await asyncio.gather(*(self.fetch_url_content_async(url) for url in urls))
+
+    def _conditional_headers(self, url: str) -> Tuple[Optional[tuple], Dict[str, str]]:
+        """Cached entry for the URL plus the If-None-Match/If-Modified-Since
+        headers that revalidate it (empty when nothing is cached)"""
+        with self._url_cache_lock:
+            cached = self._url_cache.get(url)
+
+        conditional_headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+        return cached, conditional_headers
+
+    def _cache_url_result(self, url: str, response, result: Dict[str, str]):
+        """Store a parsed result for later conditional revalidation"""
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if not etag and not last_modified:
+            return  # Nothing to revalidate against
+
+        with self._url_cache_lock:
+            self._url_cache[url] = (etag, last_modified, result)
+            self._url_cache.move_to_end(url)
+            while len(self._url_cache) > self._url_cache_max:
+                self._url_cache.popitem(last=False)
+
+    @staticmethod
+    def _header_charset(content_type: str) -> Optional[str]:
+        """Charset declared in the Content-Type header, or None.
+
+        Only an explicit charset= parameter counts; when it is absent the
+        parser sniffs the <meta> declaration instead, which avoids any
+        whole-body character detection pass.
+        """
+        for param in content_type.split(';')[1:]:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'charset':
+                return value.strip().strip('"\'') or None
+        return None
+
+    @staticmethod
+    def _content_size(content) -> int:
+        """Byte length of a downloaded body (bytes or seekable file-like)"""
+        if isinstance(content, (bytes, bytearray)):
+            return len(content)
+        size = content.seek(0, io.SEEK_END)
+        content.seek(0)
+        return size
+
+    # MIME type -> handler, resolved once per response instead of chained
+    # substring scans; unknown types fall through to plain text
+    _DISPATCH = MappingProxyType({
+        'application/pdf': '_handle_pdf_content',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '_handle_docx_content',
+        'text/html': '_handle_html_content',
+        'application/xhtml+xml': '_handle_html_content',
+    })
+
+    def _process_response_content(self, content, content_type: str,
+                                  url: str, encoding: Optional[str]) -> Dict[str, str]:
+        """Dispatch a downloaded body (bytes or file-like) to its handler"""
+        mime = content_type.split(';', 1)[0].strip().lower()
+        handler = getattr(self, self._DISPATCH.get(mime, '_handle_plain_text'))
+        return handler(content, url, encoding)
+
+    async def aclose(self):
+        """Close the shared async HTTP client and the parse pool"""
+        await self.async_client.aclose()
+        self._parse_pool.shutdown(wait=False)
+
+    @staticmethod
+    def _result(*, content: str, title: str, url: str, content_type: str, **extra) -> Dict[str, str]:
+        """Assemble the success payload shared by every content handler"""
+        result = {
+            "status": "success",
+            "content": content,
+            "title": title,
+            "url": url,
+            "content_type": content_type,
+            "word_count": _word_count(content),
+            "fetch_timestamp": datetime.now().isoformat()
+        }
+        result.update(extra)
+        return result
+
     # 🚨 REPLACED FALLBACK METHOD - Never return fake success!
     def _get_error_response(self, url: str, error: str) -> Dict[str, str]:
         """Return proper error response - NO FAKE CONTENT!"""
@@ -234,52 +607,30 @@ class ContentFetcher:
             file_extension = os.path.splitext(full_path)[1].lower()
             
             if file_extension == '.pdf':
-                with pdfplumber.open(full_path) as pdf:
-                    text_pages = []
-                    for page in pdf.pages:
-                        text = page.extract_text()
-                        if text:
-                            text_pages.append(text)
-                    full_text = "\n".join(text_pages)
-                    
-                return {
-                    "status": "success",
-                    "content": full_text,
-                    "title": os.path.basename(full_path),
-                    "url": f"file://{full_path}",
-                    "content_type": "pdf",
-                    "word_count": len(full_text.split()),
-                    "fetch_timestamp": datetime.now().isoformat(),
-                    "page_count": len(text_pages)
-                }
+                text_pages = [t for t in self._extract_pdf_pages(path=full_path) if t]
+                full_text = "\n".join(text_pages)
+
+
+                return self._result(
+                    content=full_text, title=os.path.basename(full_path),
+                    url=f"file://{full_path}", content_type="pdf",
+                    page_count=len(text_pages))
                 
             elif file_extension == '.docx':
                 doc = docx.Document(full_path)
                 full_text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
                 
-                return {
-                    "status": "success",
-                    "content": full_text,
-                    "title": os.path.basename(full_path),
-                    "url": f"file://{full_path}",
-                    "content_type": "docx",
-                    "word_count": len(full_text.split()),
-                    "fetch_timestamp": datetime.now().isoformat()
-                }
+                return self._result(
+                    content=full_text, title=os.path.basename(full_path),
+                    url=f"file://{full_path}", content_type="docx")
                 
             elif file_extension in ['.txt', '.md']:
                 with open(full_path, 'r', encoding='utf-8') as file:
                     content = file.read()
                 
-                return {
-                    "status": "success",
-                    "content": content,
-                    "title": os.path.basename(full_path),
-                    "url": f"file://{full_path}",
-                    "content_type": "plain_text",
-                    "word_count": len(content.split()),
-                    "fetch_timestamp": datetime.now().isoformat()
-                }
+                return self._result(
+                    content=content, title=os.path.basename(full_path),
+                    url=f"file://{full_path}", content_type="plain_text")
                 
             else:
                 return {
@@ -302,21 +653,22 @@ class ContentFetcher:
             }
 
     # UPDATED CONTENT HANDLERS
-    def _handle_html_content(self, content: bytes, url: str, encoding: str = 'utf-8') -> Dict[str, str]:
+    def _handle_html_content(self, content, url: str, encoding: Optional[str] = None) -> Dict[str, str]:
         """Process HTML content with enhanced extraction"""
         try:
-            soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
-            
-            # Remove potentially dangerous elements
-            for element in soup(["script", "style", "nav", "header", "footer", "aside", "meta", "link", "button", "form"]):
-                element.decompose()
-            
-            # Remove elements with dangerous attributes
+            soup = BeautifulSoup(content, _BS_PARSER, from_encoding=encoding)
+
+            # Remove dangerous elements and attributes in one traversal
+            # instead of a decompose pass plus a find_all pass
             for tag in soup.find_all(True):
-                for attr in ['onclick', 'onload', 'onerror', 'onmouseover']:
-                    if attr in tag.attrs:
-                        del tag.attrs[attr]
-            
+                if tag.decomposed:
+                    continue  # inside an already-removed subtree
+                if tag.name in self._STRIPPED_TAGS:
+                    tag.decompose()
+                else:
+                    for attr in self._EVENT_ATTRS:
+                        tag.attrs.pop(attr, None)
+
             title = self._extract_title(soup)
             main_content = self._extract_main_content(soup)
             metadata = self._extract_metadata(soup)
@@ -324,16 +676,9 @@ class ContentFetcher:
             # Clean text
             clean_content = self._clean_extracted_text(main_content)
             
-            result = {
-                "status": "success",
-                "content": clean_content,
-                "title": title,
-                "url": url,
-                "content_type": "web_page",
-                "word_count": len(clean_content.split()),
-                "fetch_timestamp": datetime.now().isoformat(),
-                "metadata": metadata
-            }
+            result = self._result(
+                content=clean_content, title=title, url=url,
+                content_type="web_page", metadata=metadata)
             
             # Add content analysis
             result.update(self.analyze_content_type(clean_content))
@@ -342,10 +687,47 @@ class ContentFetcher:
         except Exception as e:
             return self._get_error_response(url, f"HTML processing failed: {str(e)}")
 
-    def _handle_pdf_content(self, content: bytes, url: str) -> Dict[str, str]:
-        """Extract text from PDF content with error handling"""
+    def _extract_pdf_pages(self, stream: bytes = None, path: str = None) -> List[str]:
+        """Extract per-page PDF text, preferring the native PyMuPDF backend"""
+        pages = []
+        if fitz is not None:
+            if path:
+                doc = fitz.open(path)
+            else:
+                # fitz wants the whole buffer; spooled bodies are read once
+                data = stream if isinstance(stream, (bytes, bytearray)) else stream.read()
+                doc = fitz.open(stream=data, filetype='pdf')
+            try:
+                for page in doc:
+                    try:
+                        pages.append(page.get_text('text'))
+                    except Exception as e:
+                        self.logger.warning(f"Failed to extract text from PDF page: {e}")
+            finally:
+                doc.close()
+        else:
+            if path:
+                source = path
+            elif isinstance(stream, (bytes, bytearray)):
+                source = io.BytesIO(stream)
+            else:
+                source = stream  # already a file-like, no copy needed
+            with pdfplumber.open(source) as pdf:
+                for page in pdf.pages:
+                    try:
+                        pages.append(page.extract_text() or "")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to extract text from PDF page: {e}")
+        return pages
+
+    def _handle_pdf_content(self, content, url: str, encoding: Optional[str] = None) -> Dict[str, str]:
+        """Extract text from PDF content with error handling.
+
+        `encoding` is accepted for dispatch-signature uniformity; binary
+        formats carry their own encoding.
+        """
         try:
-            if len(content) > self.max_file_size:
+            if self._content_size(content) > self.max_file_size:
                 return {
                     "status": "error",
                     "error": "PDF file too large",
@@ -353,36 +735,26 @@ class ContentFetcher:
                     "content": ""
                 }
                 
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                text_pages = []
-                for page in pdf.pages:
-                    try:
-                        text = page.extract_text()
-                        if text and len(text.strip()) > 0:
-                            text_pages.append(text)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract text from PDF page: {e}")
-                        continue
-                
-                full_text = "\n".join(text_pages)
-                
-            return {
-                "status": "success",
-                "content": full_text,
-                "title": f"PDF Document from {urlparse(url).netloc}",
-                "url": url,
-                "content_type": "pdf",
-                "word_count": len(full_text.split()),
-                "fetch_timestamp": datetime.now().isoformat(),
-                "page_count": len(text_pages)
-            }
+            text_pages = [t for t in self._extract_pdf_pages(stream=content)
+                          if t and len(t.strip()) > 0]
+            full_text = "\n".join(text_pages)
+
+
+            return self._result(
+                content=full_text,
+                title=f"PDF Document from {urlparse(url).netloc}",
+                url=url, content_type="pdf", page_count=len(text_pages))
         except Exception as e:
             return self._get_error_response(url, f"PDF extraction failed: {e}")
 
-    def _handle_docx_content(self, content: bytes, url: str) -> Dict[str, str]:
-        """Extract text from DOCX content with error handling"""
+    def _handle_docx_content(self, content, url: str, encoding: Optional[str] = None) -> Dict[str, str]:
+        """Extract text from DOCX content with error handling.
+
+        `encoding` is accepted for dispatch-signature uniformity; binary
+        formats carry their own encoding.
+        """
         try:
-            if len(content) > self.max_file_size:
+            if self._content_size(content) > self.max_file_size:
                 return {
                     "status": "error",
                     "error": "DOCX file too large",
@@ -390,69 +762,173 @@ class ContentFetcher:
                     "content": ""
                 }
                 
-            doc = docx.Document(io.BytesIO(content))
+            doc = docx.Document(
+                io.BytesIO(content) if isinstance(content, (bytes, bytearray)) else content)
             full_text = "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
             
-            return {
-                "status": "success",
-                "content": full_text,
-                "title": f"Word Document from {urlparse(url).netloc}",
-                "url": url,
-                "content_type": "docx",
-                "word_count": len(full_text.split()),
-                "fetch_timestamp": datetime.now().isoformat()
-            }
+            return self._result(
+                content=full_text,
+                title=f"Word Document from {urlparse(url).netloc}",
+                url=url, content_type="docx")
         except Exception as e:
             return self._get_error_response(url, f"DOCX extraction failed: {e}")
 
+    def _handle_plain_text(self, content, url: str, encoding: Optional[str] = None) -> Dict[str, str]:
+        """Handle plain text content"""
+        try:
+            if not isinstance(content, (bytes, bytearray)):
+                content = content.read()
+            text = content.decode(encoding or 'utf-8', errors='replace')
+            clean_content = self._clean_extracted_text(text)
+
+            return self._result(
+                content=clean_content,
+                title=f"Document from {urlparse(url).netloc}",
+                url=url, content_type="plain_text")
+        except Exception as e:
+            return self._get_error_response(url, f"Text processing failed: {e}")
+
+    # Selector priority for main-content extraction, best match first
+    _CONTENT_CLASSES = {
+        'content': 3, 'main-content': 4, 'article-content': 5,
+        'post-content': 6, 'entry-content': 7, 'story-content': 8,
+        'document': 12, 'text': 13, 'body': 14
+    }
+    _CONTENT_IDS = {'content': 9, 'main': 10, 'article': 11}
+
+    # Metadata selectors, built once instead of per call
+    _DATE_SELECTORS = (
+        'meta[property="article:published_time"]',
+        'meta[name="publication-date"]',
+        'meta[name="publish_date"]',
+        'time[datetime]'
+    )
+    _AUTHOR_SELECTORS = (
+        'meta[name="author"]',
+        'meta[property="article:author"]',
+        '.author', '[rel="author"]'
+    )
+
+    # Content-type indicator terms, shared across calls
+    _FINANCIAL_INDICATORS = (
+        'sec', 'earnings', 'revenue', 'profit', 'loss', 'debt', 'equity',
+        'financial', 'quarterly', 'annual', 'ebitda', 'margin', 'assets'
+    )
+    _RISK_INDICATORS = (
+        'risk', 'uncertainty', 'volatility', 'default', 'investigation',
+        'compliance', 'regulatory', 'cybersecurity', 'threat', 'vulnerability'
+    )
+    _STRUCTURE_MARKERS = (
+        'item 1a', 'risk factors', 'earnings call', 'q&a', 'press release',
+        'reuters', 'bloomberg', 'financial times', 'wsj', 'wall street journal',
+        'regulation', 'enforcement', 'oversight'
+    )
+
+    # One automaton over every indicator, built once per process; falls
+    # back to plain substring scans when pyahocorasick is not installed
+    _INDICATOR_AUTOMATON = None
+    if ahocorasick is not None:
+        _INDICATOR_AUTOMATON = ahocorasick.Automaton()
+        for _term in set(_FINANCIAL_INDICATORS + _RISK_INDICATORS + _STRUCTURE_MARKERS):
+            _INDICATOR_AUTOMATON.add_word(_term, _term)
+        _INDICATOR_AUTOMATON.make_automaton()
+        del _term
+
     # EXISTING METHODS (keep these as they were)
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
         """Extract main content using multiple strategies"""
-        content_selectors = [
-            'main', 'article', '[role="main"]', 
-            '.content', '.main-content', '.article-content',
-            '.post-content', '.entry-content', '.story-content',
-            '#content', '#main', '#article',
-            '.document', '.text', '.body'
-        ]
-        
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                largest_element = max(elements, key=lambda el: len(el.get_text().strip()))
-                content = largest_element.get_text()
-                if len(content.split()) > 100:
-                    return content
-        
-        candidates = soup.find_all(['div', 'section', 'main'])
-        if candidates:
-            scored_candidates = []
-            for candidate in candidates:
-                text = candidate.get_text().strip()
-                if len(text.split()) < 50:
-                    continue
-                
-                html_length = len(str(candidate))
-                text_length = len(text)
-                if html_length > 0:
-                    density = text_length / html_length
-                else:
-                    density = 0
-                
-                link_count = len(candidate.find_all('a'))
-                link_penalty = min(link_count / 10, 1.0)
-                
-                score = density * (1 - link_penalty)
-                scored_candidates.append((score, candidate))
-            
-            if scored_candidates:
-                best_candidate = max(scored_candidates, key=lambda x: x[0])
-                return best_candidate[1].get_text()
-        
+        # One post-order walk gathers subtree text lengths, link counts
+        # and selector matches; the old per-selector soup.select() plus
+        # get_text() per candidate re-traversed the tree O(nodes^2)
+        text_len = {}
+        html_len = {}
+        link_count = {}
+        tier_hits = {}
+        block_candidates = []
+
+        stack = [(soup, False)]
+        while stack:
+            el, visited = stack.pop()
+            if visited:
+                total = 0
+                links = 0
+                markup = 0
+                for child in el.children:
+                    if isinstance(child, NavigableString):
+                        total += len(child)
+                        markup += len(child)
+                    elif isinstance(child, Tag):
+                        total += text_len[id(child)]
+                        markup += html_len[id(child)]
+                        links += link_count[id(child)] + (1 if child.name == 'a' else 0)
+                text_len[id(el)] = total
+                link_count[id(el)] = links
+                # Serialized-size estimate: children plus this element's
+                # own tags; close enough for density scoring without
+                # re-serializing the subtree via str(el)
+                name_len = len(el.name) if isinstance(el, Tag) else 0
+                html_len[id(el)] = markup + 2 * name_len + 5
+                continue
+
+            stack.append((el, True))
+            if isinstance(el, Tag):
+                name = el.name
+                if name == 'main':
+                    tier_hits.setdefault(0, []).append(el)
+                elif name == 'article':
+                    tier_hits.setdefault(1, []).append(el)
+                if el.get('role') == 'main':
+                    tier_hits.setdefault(2, []).append(el)
+                for cls in el.get('class') or ():
+                    tier = self._CONTENT_CLASSES.get(cls)
+                    if tier is not None:
+                        tier_hits.setdefault(tier, []).append(el)
+                tier = self._CONTENT_IDS.get(el.get('id'))
+                if tier is not None:
+                    tier_hits.setdefault(tier, []).append(el)
+                if name in ('div', 'section', 'main'):
+                    block_candidates.append(el)
+            for child in el.children:
+                if isinstance(child, Tag):
+                    stack.append((child, False))
+
+        for tier in sorted(tier_hits):
+            elements = tier_hits[tier]
+            largest_element = max(elements, key=lambda el: text_len[id(el)])
+            content = largest_element.get_text()
+            if len(content.split()) > 100:
+                return content
+
+        scored_candidates = []
+        for candidate in block_candidates:
+            # 50 words need at least 99 characters; prune on the cached
+            # length before paying for get_text()
+            if text_len[id(candidate)] < 99:
+                continue
+            text = candidate.get_text().strip()
+            if len(text.split()) < 50:
+                continue
+
+            html_length = html_len[id(candidate)]
+            text_length = len(text)
+            if html_length > 0:
+                density = text_length / html_length
+            else:
+                density = 0
+
+            link_penalty = min(link_count[id(candidate)] / 10, 1.0)
+
+            score = density * (1 - link_penalty)
+            scored_candidates.append((score, candidate))
+
+        if scored_candidates:
+            best_candidate = max(scored_candidates, key=lambda x: x[0])
+            return best_candidate[1].get_text()
+
         body = soup.find('body')
         if body:
             return body.get_text()
-        
+
         return soup.get_text()
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
@@ -496,14 +972,7 @@ class ContentFetcher:
         if keywords and keywords.get('content'):
             metadata['keywords'] = keywords['content']
         
-        date_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="publication-date"]',
-            'meta[name="publish_date"]',
-            'time[datetime]'
-        ]
-        
-        for selector in date_selectors:
+        for selector in self._DATE_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 date_value = element.get('content') or element.get('datetime')
@@ -511,13 +980,7 @@ class ContentFetcher:
                     metadata['publication_date'] = date_value
                     break
         
-        author_selectors = [
-            'meta[name="author"]',
-            'meta[property="article:author"]',
-            '.author', '[rel="author"]'
-        ]
-        
-        for selector in author_selectors:
+        for selector in self._AUTHOR_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 author = element.get('content') or element.get_text()
@@ -532,30 +995,20 @@ class ContentFetcher:
         if not text:
             return ""
         
-        text = re.sub(r'\s+', ' ', text)
-        
-        boilerplate_patterns = [
-            r'Privacy Policy.*?',
-            r'Terms of Service.*?',
-            r'Cookie Policy.*?',
-            r'Sign up.*?newsletter',
-            r'Subscribe.*?',
-            r'Follow us.*?',
-            r'Copyright.*?\d{4}',
-            r'All rights reserved.*?',
-            r'Loading\.\.\.',
-            r'Please enable JavaScript.*?',
-            r'ADVERTISEMENT',
-            r'Sponsored Content.*?'
-        ]
-        
-        for pattern in boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        lines = text.split('. ')
-        cleaned_lines = [line.strip() for line in lines if len(line.split()) > 3]
+        # str.split()/join collapse whitespace in one C pass, several times
+        # faster than the \s+ regex on megabyte pages (and it also strips
+        # the ends, which the final strip() did anyway)
+        text = ' '.join(text.split())
+        if _HS_DB is not None:
+            text = _hyperscan_strip(text)
+        else:
+            text = self._BOILERPLATE_RE.sub('', text)
         
-        return '. '.join(cleaned_lines).strip()
+        # Whitespace is already collapsed to single spaces above, so
+        # counting separators replaces re-splitting every fragment into a
+        # throwaway word list, and the per-fragment strip() is redundant
+        return '. '.join(
+            line for line in text.split('. ') if line.count(' ') >= 3).strip()
 
     def analyze_content_type(self, content: str) -> Dict[str, str]:
         """Analyze content type and characteristics"""
@@ -570,40 +1023,42 @@ class ContentFetcher:
             "confidence_score": 0
         }
         
-        financial_indicators = [
-            'sec', 'earnings', 'revenue', 'profit', 'loss', 'debt', 'equity',
-            'financial', 'quarterly', 'annual', 'ebitda', 'margin', 'assets'
-        ]
-        financial_score = sum(1 for indicator in financial_indicators if indicator in content_lower)
-        
-        risk_indicators = [
-            'risk', 'uncertainty', 'volatility', 'default', 'investigation',
-            'compliance', 'regulatory', 'cybersecurity', 'threat', 'vulnerability'
-        ]
-        risk_score = sum(1 for indicator in risk_indicators if indicator in content_lower)
-        
+        # One automaton sweep collects which indicators occur at all; the
+        # checks below become set lookups. Presence (not match counts) is
+        # what the original per-term scans measured.
+        if self._INDICATOR_AUTOMATON is not None:
+            present = {term for _, term in self._INDICATOR_AUTOMATON.iter(content_lower)}
+            found = present.__contains__
+        else:
+            found = content_lower.__contains__
+
+        financial_score = sum(
+            1 for indicator in self._FINANCIAL_INDICATORS if found(indicator))
+        risk_score = sum(
+            1 for indicator in self._RISK_INDICATORS if found(indicator))
+
         if financial_score >= 5 and risk_score >= 3:
             analysis["financial_content"] = True
             analysis["risk_content"] = True
             analysis["confidence_score"] = min(100, (financial_score + risk_score) * 10)
-        
-        if 'item 1a' in content_lower and 'risk factors' in content_lower:
+
+        if found('item 1a') and found('risk factors'):
             analysis["content_type"] = "sec_filing"
             analysis["document_structure"] = "structured"
             analysis["confidence_score"] = 95
-        elif 'earnings call' in content_lower or 'q&a' in content_lower:
+        elif found('earnings call') or found('q&a'):
             analysis["content_type"] = "earnings_transcript"
             analysis["confidence_score"] = 85
-        elif 'press release' in content_lower:
+        elif found('press release'):
             analysis["content_type"] = "press_release"
             analysis["confidence_score"] = 80
-        elif any(site in content_lower for site in ['reuters', 'bloomberg', 'financial times', 'wsj', 'wall street journal']):
+        elif any(found(site) for site in ['reuters', 'bloomberg', 'financial times', 'wsj', 'wall street journal']):
             analysis["content_type"] = "financial_news"
             analysis["confidence_score"] = 75
-        
-        if any(word in content_lower for word in ['regulation', 'compliance', 'enforcement', 'oversight']):
+
+        if any(found(word) for word in ['regulation', 'compliance', 'enforcement', 'oversight']):
             analysis["regulatory_content"] = True
-        
+
         return analysis
 
 # USAGE EXAMPLE
@@ -619,9 +1074,15 @@ if __name__ == "__main__":
         "http://localhost/internal",        # Blocked - internal IP
     ]
     
-    for url in test_urls:
+    async def _run_tests():
+        try:
+            return await fetcher.fetch_many(test_urls)
+        finally:
+            await fetcher.aclose()
+
+    # Fetches overlap instead of running back-to-back
+    for url, result in zip(test_urls, asyncio.run(_run_tests())):
         print(f"Fetching: {url}")
-        result = fetcher.fetch_content(url)
         print(f"Status: {result['status']}")
         if result['status'] == 'error':
             print(f"Error: {result['error']}")
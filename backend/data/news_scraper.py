@@ -2,17 +2,84 @@
 Financial news scraping and processing with API integrations
 """
 import re
+import numpy as np
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
-import hashlib
+from collections import Counter, OrderedDict
+import zlib
+
+# lxml parses via libxml2 (~10x faster than the pure-Python html.parser);
+# fall back when the wheel is missing
+try:
+    import lxml  # noqa: F401 - probe for the BeautifulSoup backend
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+# Skip script/style/svg/noscript subtrees at parse time: none of the
+# extraction selectors touch them and on ad-heavy news pages they are a
+# large share of the document
+_PARSE_STRAINER = SoupStrainer(
+    lambda name, attrs=None: name not in ('script', 'style', 'svg', 'noscript'))
+
 
 class FinancialNewsScraper:
+    # Sentiment vocabularies, shared by every instance
+    _POSITIVE_TERMS = (
+        'growth', 'profit', 'gain', 'increase', 'positive', 'strong', 'recovery',
+        'outperform', 'bullish', 'optimistic', 'surge', 'rally', 'boom', 'success',
+        'expansion', 'record', 'beat', 'exceed', 'upside', 'opportunity'
+    )
+    _NEGATIVE_TERMS = (
+        'decline', 'loss', 'drop', 'decrease', 'negative', 'weak', 'crisis',
+        'underperform', 'bearish', 'pessimistic', 'plunge', 'collapse', 'bankruptcy',
+        'recession', 'default', 'failure', 'downturn', 'risk', 'uncertainty'
+    )
+    _RISK_TERMS = (
+        'risk', 'uncertainty', 'volatility', 'default', 'investigation', 'lawsuit',
+        'breach', 'outage', 'failure', 'fines', 'penalties', 'scrutiny', 'probe',
+        'violation', 'non-compliance', 'sanctions', 'litigation', 'fraud'
+    )
+    _REGULATORY_TERMS = (
+        'sec', 'regulation', 'regulatory', 'compliance', 'enforcement', 'oversight',
+        'investigation', 'subpoena', 'audit', 'examination'
+    )
+    _MARKET_TERMS = (
+        'market', 'trading', 'volatility', 'liquidity', 'capital', 'investment',
+        'stocks', 'bonds', 'equities', 'securities', 'derivatives'
+    )
+    _TERM_CATEGORIES = (
+        ('positive', _POSITIVE_TERMS),
+        ('negative', _NEGATIVE_TERMS),
+        ('risk', _RISK_TERMS),
+        ('regulatory', _REGULATORY_TERMS),
+        ('market', _MARKET_TERMS),
+    )
+
+    # Token -> categories lookup: O(1) dict hit per word instead of any
+    # substring scan, and exact matching stops 'gain' counting 'again'
+    # or 'bargain' the way 'term in word' did
+    _TERM_LOOKUP = {}
+    for _cat, _terms in _TERM_CATEGORIES:
+        for _term in _terms:
+            _cats = _TERM_LOOKUP.setdefault(_term, [])
+            if _cat not in _cats:
+                _cats.append(_cat)
+    _TERM_LOOKUP = {_term: tuple(_cats) for _term, _cats in _TERM_LOOKUP.items()}
+    del _cat, _terms, _term, _cats
+
+    # Lowercase tokens, keeping hyphenated terms like 'non-compliance'
+    _TOKEN_RE = re.compile(r'[a-z]+(?:-[a-z]+)*')
+
     def __init__(self, newsapi_key: str = None, alphavantage_key: str = None):
         self.news_sources = {
             'reuters': {
@@ -72,7 +139,20 @@ class FinancialNewsScraper:
         
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-        
+
+        # Pooled keep-alive connections: consecutive articles from the
+        # same outlet reuse the TCP+TLS session instead of re-handshaking
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Scraped-article TTL LRU: re-requesting the same URL within the
+        # window skips the fetch and parse entirely
+        self._article_cache = OrderedDict()
+        self._article_cache_lock = threading.Lock()
+        self._article_cache_max = 1024
+        self._article_cache_ttl = 600.0  # seconds
+
         # Configure logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -98,19 +178,24 @@ class FinancialNewsScraper:
             
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            
-            data = response.json()
-            
+
+            # orjson decodes the raw bytes several times faster than the
+            # stdlib json path behind response.json()
+            data = orjson.loads(response.content)
+
             articles = []
             for article in data.get('articles', []):
+                # Pull shared fields once instead of re-getting them per key
+                description = article.get('description') or ''
+                source = article.get('source') or {}
                 processed_article = {
                     'title': article.get('title', ''),
-                    'content': article.get('description', '') or article.get('content', ''),
-                    'source': article.get('source', {}).get('name', 'unknown'),
+                    'content': description or article.get('content', ''),
+                    'source': source.get('name', 'unknown'),
                     'url': article.get('url', ''),
                     'publish_date': article.get('publishedAt', ''),
                     'author': article.get('author', ''),
-                    'word_count': len((article.get('description') or '').split()),
+                    'word_count': len(description.split()),
                     'status': 'api_success',
                     'api_source': 'newsapi'
                 }
@@ -145,9 +230,9 @@ class FinancialNewsScraper:
             
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            
-            data = response.json()
-            
+
+            data = orjson.loads(response.content)
+
             articles = []
             for feed in data.get('feed', []):
                 processed_article = {
@@ -179,11 +264,21 @@ class FinancialNewsScraper:
     # 🔄 ENHANCED SCRAPING WITH FALLBACK APIS
     def scrape_news_article(self, url: str, use_api_fallback: bool = True) -> Dict[str, str]:
         """Scrape financial news article from URL with API fallback"""
+        now = time.monotonic()
+        with self._article_cache_lock:
+            cached = self._article_cache.get(url)
+            if cached and now - cached[0] < self._article_cache_ttl:
+                self._article_cache.move_to_end(url)
+                # Copy so callers mutating the result don't poison the cache
+                return dict(cached[1])
+            if cached:
+                del self._article_cache[url]
+
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _BS_PARSER, parse_only=_PARSE_STRAINER)
             
             # Identify news source
             source = self._identify_news_source(url)
@@ -198,8 +293,15 @@ class FinancialNewsScraper:
             # Analyze sentiment and risk
             sentiment = self.analyze_news_sentiment(article_data['content'])
             article_data.update(sentiment)
-            
-            return article_data
+
+            # Only real scrapes are cached; fallback/demo results are not
+            with self._article_cache_lock:
+                self._article_cache[url] = (now, article_data)
+                self._article_cache.move_to_end(url)
+                while len(self._article_cache) > self._article_cache_max:
+                    self._article_cache.popitem(last=False)
+
+            return dict(article_data)
             
         except Exception as e:
             self.logger.warning(f"Scraping failed for {url}: {e}")
@@ -213,24 +315,31 @@ class FinancialNewsScraper:
             return self._get_demo_financial_news(url)
 
     # 🔄 BATCH SCRAPING WITH RATE LIMITING
-    def scrape_multiple_articles(self, urls: List[str], delay: float = 1.0) -> List[Dict]:
-        """Scrape multiple articles with rate limiting"""
-        articles = []
-        
-        for i, url in enumerate(urls):
-            try:
-                article = self.scrape_news_article(url)
-                articles.append(article)
-                
-                # Rate limiting
-                if i < len(urls) - 1:
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to scrape {url}: {e}")
-                articles.append(self._get_demo_financial_news(url))
-        
-        return articles
+    def scrape_multiple_articles(self, urls: List[str], delay: float = 1.0,
+                                 max_workers: int = 8) -> List[Dict]:
+        """Scrape multiple articles concurrently with per-host limits.
+
+        Distinct outlets are fetched in parallel, so batch wall-clock time
+        tracks the slowest article instead of the sum. A semaphore per
+        host (2 slots, spaced by `delay`) keeps any single site from
+        being hammered the way the old global sleep did.
+        """
+        host_slots = {host: threading.Semaphore(2)
+                      for host in {urlparse(url).netloc for url in urls}}
+
+        def scrape(url: str) -> Dict:
+            with host_slots[urlparse(url).netloc]:
+                try:
+                    return self.scrape_news_article(url)
+                except Exception as e:
+                    self.logger.error(f"Failed to scrape {url}: {e}")
+                    return self._get_demo_financial_news(url)
+                finally:
+                    time.sleep(delay)  # pace the host before freeing the slot
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(scrape, url) for url in urls]
+            return [future.result() for future in futures]
 
     # 🔄 ENHANCED CONTENT EXTRACTION
     def _extract_article_content(self, soup: BeautifulSoup, source: str) -> Dict[str, str]:
@@ -271,115 +380,95 @@ class FinancialNewsScraper:
 
     def _extract_with_selectors(self, soup: BeautifulSoup, selector_string: str) -> str:
         """Extract text using multiple CSS selectors"""
-        for selector in selector_string.split(', '):
-            element = soup.select_one(selector.strip())
-            if element:
-                text = element.get_text().strip()
-                if text:
-                    return text
+        # soupsieve evaluates the comma-separated group in one tree walk;
+        # the old per-selector loop re-walked the tree for each alternative
+        for element in soup.select(selector_string):
+            text = element.get_text().strip()
+            if text:
+                return text
         return ''
 
+    _MAX_PARAGRAPHS = 20
+
     def _extract_content_advanced(self, soup: BeautifulSoup, selector_string: str) -> str:
         """Advanced content extraction with paragraph scoring"""
-        content_parts = []
-        
-        # Try structured selectors first
-        for selector in selector_string.split(', '):
-            paragraphs = soup.select(selector.strip())
-            for p in paragraphs:
-                text = p.get_text().strip()
-                if self._is_valid_paragraph(text):
-                    content_parts.append(text)
-        
+        # Try structured selectors first - one walk for the whole group,
+        # which also deduplicates elements matched by several alternatives
+        content_parts = self._collect_paragraphs(soup.select(selector_string))
+
         # Fallback: extract all paragraphs and score them
         if not content_parts:
-            all_paragraphs = soup.find_all('p')
-            for p in all_paragraphs:
-                text = p.get_text().strip()
-                if self._is_valid_paragraph(text):
-                    content_parts.append(text)
-        
-        return ' '.join(content_parts[:20])  # Limit to first 20 paragraphs
+            content_parts = self._collect_paragraphs(soup.find_all('p'))
+
+        return ' '.join(content_parts)
+
+    def _collect_paragraphs(self, elements) -> List[str]:
+        """First _MAX_PARAGRAPHS valid paragraph texts from `elements`.
+
+        Stops at the cap, so the (often long) tail of comment and footer
+        paragraphs is never text-extracted or regex-filtered.
+        """
+        content_parts = []
+        for p in elements:
+            text = p.get_text().strip()
+            if self._is_valid_paragraph(text):
+                content_parts.append(text)
+                if len(content_parts) >= self._MAX_PARAGRAPHS:
+                    break
+        return content_parts
+
+    # Boilerplate prefixes that mark a paragraph as navigation/ads
+    _INVALID_PARA_RE = re.compile(
+        r'subscribe|sign up|read more|follow us|copyright|privacy|terms|'
+        r'cookie|advertisement|sponsored', re.IGNORECASE)
 
     def _is_valid_paragraph(self, text: str, min_length: int = 20) -> bool:
         """Check if paragraph is valid content (not navigation, ads, etc.)"""
         if len(text) < min_length:
             return False
-        
-        invalid_patterns = [
-            r'^subscribe',
-            r'^sign up',
-            r'^read more',
-            r'^follow us',
-            r'^copyright',
-            r'^privacy',
-            r'^terms',
-            r'^cookie',
-            r'^advertisement',
-            r'^sponsored'
-        ]
-        
-        text_lower = text.lower()
-        return not any(re.match(pattern, text_lower) for pattern in invalid_patterns)
+        return not self._INVALID_PARA_RE.match(text)
 
     # 🔄 ENHANCED SENTIMENT ANALYSIS
     def analyze_news_sentiment(self, content: str) -> Dict[str, float]:
         """Enhanced sentiment analysis for financial news"""
-        positive_terms = [
-            'growth', 'profit', 'gain', 'increase', 'positive', 'strong', 'recovery',
-            'outperform', 'bullish', 'optimistic', 'surge', 'rally', 'boom', 'success',
-            'expansion', 'record', 'beat', 'exceed', 'upside', 'opportunity'
-        ]
-        
-        negative_terms = [
-            'decline', 'loss', 'drop', 'decrease', 'negative', 'weak', 'crisis',
-            'underperform', 'bearish', 'pessimistic', 'plunge', 'collapse', 'bankruptcy',
-            'recession', 'default', 'failure', 'downturn', 'risk', 'uncertainty'
-        ]
-        
-        risk_terms = [
-            'risk', 'uncertainty', 'volatility', 'default', 'investigation', 'lawsuit',
-            'breach', 'outage', 'failure', 'fines', 'penalties', 'scrutiny', 'probe',
-            'violation', 'non-compliance', 'sanctions', 'litigation', 'fraud'
-        ]
-        
-        regulatory_terms = [
-            'sec', 'regulation', 'regulatory', 'compliance', 'enforcement', 'oversight',
-            'investigation', 'subpoena', 'subpoena', 'audit', 'examination'
-        ]
-        
-        market_terms = [
-            'market', 'trading', 'volatility', 'liquidity', 'capital', 'investment',
-            'stocks', 'bonds', 'equities', 'securities', 'derivatives'
-        ]
-        
-        words = content.lower().split()
-        total_words = len(words)
-        
+        # Feed the tokens straight into the counter: no intermediate list
+        # of every word in the article, just the distinct-token table
+        token_counts = Counter(
+            match.group() for match in self._TOKEN_RE.finditer(content.lower()))
+        total_words = sum(token_counts.values())
+
         if total_words == 0:
             return {
                 'positive_sentiment': 0,
-                'negative_sentiment': 0, 
+                'negative_sentiment': 0,
                 'risk_density': 0,
                 'regulatory_density': 0,
                 'market_density': 0,
                 'overall_sentiment': 0
             }
-        
-        positive_score = sum(1 for word in words if any(term in word for term in positive_terms))
-        negative_score = sum(1 for word in words if any(term in word for term in negative_terms))
-        risk_score = sum(1 for word in words if any(term in word for term in risk_terms))
-        regulatory_score = sum(1 for word in words if any(term in word for term in regulatory_terms))
-        market_score = sum(1 for word in words if any(term in word for term in market_terms))
-        
-        overall_sentiment = ((positive_score - negative_score) / total_words) * 100
-        
+
+        # Aggregate duplicate tokens in C first, then probe the lookup
+        # once per distinct token (plus a plural fold so 'profits'/'risks'
+        # still count toward 'profit'/'risk'); long articles repeat words
+        # heavily, so this cuts the Python-level loop to the vocabulary size
+        counts = {category: 0 for category, _ in self._TERM_CATEGORIES}
+        lookup = self._TERM_LOOKUP
+        for word, occurrences in token_counts.items():
+            categories = lookup.get(word)
+            if categories is None and word.endswith('s'):
+                categories = lookup.get(word[:-1])
+            if categories:
+                for category in categories:
+                    counts[category] += occurrences
+
+        overall_sentiment = ((counts['positive'] - counts['negative']) / total_words) * 100
+
         return {
-            'positive_sentiment': (positive_score / total_words) * 100,
-            'negative_sentiment': (negative_score / total_words) * 100,
-            'risk_density': (risk_score / total_words) * 100,
-            'regulatory_density': (regulatory_score / total_words) * 100,
-            'market_density': (market_score / total_words) * 100,
+            'positive_sentiment': (counts['positive'] / total_words) * 100,
+            'negative_sentiment': (counts['negative'] / total_words) * 100,
+            'risk_density': (counts['risk'] / total_words) * 100,
+            'regulatory_density': (counts['regulatory'] / total_words) * 100,
+            'market_density': (counts['market'] / total_words) * 100,
             'overall_sentiment': overall_sentiment
         }
 
@@ -403,25 +492,23 @@ class FinancialNewsScraper:
         else:
             return 'generic'
 
+    # Fused ad/boilerplate alternation, compiled once; the trailing lazy
+    # ".*?" quantifiers of the original list matched empty, so the plain
+    # literals are equivalent. The spanning quantifiers are bounded so a
+    # page with "Subscribe" but no "now" cannot make the engine crawl to
+    # the end of the document before giving up
+    _ADS_RE = re.compile(
+        r'(?:Subscribe.{0,60}?now)|(?:Sign up.{0,60}?newsletter)|(?:Read more)|'
+        r'(?:Reporting by)|(?:Our Standards)|(?:Copyright.{0,80}?\d{4})|'
+        r'(?:All rights reserved)|(?:ADVERTISEMENT)|(?:Sponsored Content)',
+        re.IGNORECASE)
+    _WHITESPACE_RE = re.compile(r'\s+')
+
     # 🔄 CLEAN CONTENT (keep existing)
     def _clean_news_content(self, content: str) -> str:
         """Clean and normalize news content"""
-        ads_patterns = [
-            r'Subscribe.*?now',
-            r'Sign up.*?newsletter',
-            r'Read more.*?',
-            r'Reporting by.*?',
-            r'Our Standards.*?',
-            r'Copyright.*?\d{4}',
-            r'All rights reserved.*?',
-            r'ADVERTISEMENT',
-            r'Sponsored Content.*?'
-        ]
-        
-        for pattern in ads_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-        
-        content = re.sub(r'\s+', ' ', content)
+        content = self._ADS_RE.sub('', content)
+        content = self._WHITESPACE_RE.sub(' ', content)
         return content.strip()
 
     # 🔄 DEMO CONTENT (keep existing)
@@ -448,8 +535,9 @@ class FinancialNewsScraper:
             }
         ]
         
-        url_hash = int(hashlib.md5(url.encode()).hexdigest(), 16)
-        article = demo_articles[url_hash % len(demo_articles)]
+        # crc32 is plenty for a deterministic 2-way bucket; md5 plus the
+        # hexdigest->int round-trip was cryptographic overkill
+        article = demo_articles[zlib.crc32(url.encode()) % len(demo_articles)]
         
         # Add sentiment analysis to demo content too
         sentiment = self.analyze_news_sentiment(article['content'])
@@ -469,6 +557,24 @@ class FinancialNewsScraper:
         total_score = sum(risk_factors.values())
         return min(total_score, 100)  # Cap at 100
 
+    def calculate_risk_scores(self, articles: List[Dict]) -> List[float]:
+        """Risk scores for a batch of articles in one vectorized pass.
+
+        Same weights and cap as calculate_risk_score, but a single matrix
+        product replaces the per-article Python arithmetic when scoring
+        an API page of ~50 articles.
+        """
+        if not articles:
+            return []
+        factors = np.array([
+            [article.get('negative_sentiment', 0),
+             article.get('risk_density', 0),
+             article.get('regulatory_density', 0)]
+            for article in articles
+        ])
+        weights = np.array([0.3, 0.4, 0.3])
+        return np.minimum(factors @ weights, 100).tolist()
+
 # USAGE EXAMPLE
 if __name__ == "__main__":
     # Initialize with API keys
@@ -4,7 +4,16 @@ Advanced financial risk detection without ML
 import re
 from typing import Dict, List, Any
 
+# Optional: pyahocorasick sweeps every keyword/indicator/phrase in one
+# pass per sentence instead of one substring scan per term
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 class FinancialRiskAnalyzer:
+    _AMOUNT_RE = re.compile(r'\$\d+(?:\.\d+)?(?:\s+[mb]illion)?')
+
     def __init__(self):
         self.risk_categories = {
             "credit_risk": {
@@ -40,63 +49,89 @@ class FinancialRiskAnalyzer:
                 "color": "#96CEB4"
             }
         }
-    
+
+        # One automaton over every term of every category: a single
+        # sweep per sentence replaces ~30 substring scans. Terms are
+        # added verbatim so matching semantics stay identical to the
+        # "term in sentence_lower" checks of the fallback path.
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            terms = set()
+            for config in self.risk_categories.values():
+                terms.update(config["keywords"])
+                terms.update(config["intensity_indicators"])
+                terms.update(config["context_phrases"])
+            for term in terms:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+            self._term_automaton = automaton
+        else:
+            self._term_automaton = None
+
     def analyze_risk_context(self, text: str) -> List[Dict[str, Any]]:
         """Advanced risk analysis with context awareness"""
-        text_lower = text.lower()
         sentences = re.split(r'[.!?]+', text)
-        
+
+        risk_instances_by_type = {risk_type: [] for risk_type in self.risk_categories}
+        total_intensity_by_type = {risk_type: 0 for risk_type in self.risk_categories}
+
+        for sentence in sentences:
+            sentence_lower = sentence.lower().strip()
+            if not sentence_lower:
+                continue
+
+            # All categories share one sweep of the sentence
+            if self._term_automaton is not None:
+                matched = {term for _, term in self._term_automaton.iter(sentence_lower)}
+            else:
+                matched = None
+            amount_matches = None
+
+            for risk_type, config in self.risk_categories.items():
+                # Find risk keywords in sentence
+                if matched is not None:
+                    found_keywords = [k for k in config["keywords"] if k in matched]
+                else:
+                    found_keywords = [k for k in config["keywords"] if k in sentence_lower]
+
+                if not found_keywords:
+                    continue
+
+                # Base score from keyword count
+                intensity_score = len(found_keywords) * 10
+
+                # Intensity modifiers and context awareness
+                if matched is not None:
+                    intensity_score += 20 * sum(
+                        1 for indicator in config["intensity_indicators"] if indicator in matched)
+                    intensity_score += 15 * sum(
+                        1 for phrase in config["context_phrases"] if phrase in matched)
+                else:
+                    intensity_score += 20 * sum(
+                        1 for indicator in config["intensity_indicators"] if indicator in sentence_lower)
+                    intensity_score += 15 * sum(
+                        1 for phrase in config["context_phrases"] if phrase in sentence_lower)
+
+                # Financial magnitude detection (once per sentence)
+                if amount_matches is None:
+                    amount_matches = self._AMOUNT_RE.findall(sentence)
+                if amount_matches:
+                    intensity_score += len(amount_matches) * 10
+
+                risk_instances_by_type[risk_type].append({
+                    "sentence": sentence.strip(),
+                    "keywords": found_keywords,
+                    "intensity": min(intensity_score, 100),
+                    "financial_impact": amount_matches
+                })
+                total_intensity_by_type[risk_type] += intensity_score
+
         detected_risks = []
-        
         for risk_type, config in self.risk_categories.items():
-            risk_instances = []
-            total_intensity = 0
-            
-            for sentence in sentences:
-                sentence_lower = sentence.lower().strip()
-                if not sentence_lower:
-                    continue
-                
-                # Find risk keywords in sentence
-                found_keywords = []
-                for keyword in config["keywords"]:
-                    if keyword in sentence_lower:
-                        found_keywords.append(keyword)
-                
-                if found_keywords:
-                    # Calculate sentence intensity
-                    intensity_score = 0
-                    
-                    # Base score from keyword count
-                    intensity_score += len(found_keywords) * 10
-                    
-                    # Intensity modifiers
-                    for indicator in config["intensity_indicators"]:
-                        if indicator in sentence_lower:
-                            intensity_score += 20
-                    
-                    # Context awareness
-                    for phrase in config["context_phrases"]:
-                        if phrase in sentence_lower:
-                            intensity_score += 15
-                    
-                    # Financial magnitude detection
-                    amount_matches = re.findall(r'\$\d+(?:\.\d+)?(?:\s+[mb]illion)?', sentence)
-                    if amount_matches:
-                        intensity_score += len(amount_matches) * 10
-                    
-                    risk_instances.append({
-                        "sentence": sentence.strip(),
-                        "keywords": found_keywords,
-                        "intensity": min(intensity_score, 100),
-                        "financial_impact": amount_matches
-                    })
-                    total_intensity += intensity_score
-            
+            risk_instances = risk_instances_by_type[risk_type]
             if risk_instances:
-                avg_intensity = total_intensity / len(risk_instances)
                 risk_score = self._calculate_real_risk_score(risk_instances, risk_type)  # Cap at 95%
-                
+
                 detected_risks.append({
                     "type": risk_type,
                     "score": risk_score,
@@ -106,7 +141,7 @@ class FinancialRiskAnalyzer:
                     "description": f"Detected {len(risk_instances)} risk instances",
                     "sentence_count": len(risk_instances)
                 })
-        
+
         return detected_risks
     
     def calculate_overall_risk(self, risks: List[Dict]) -> float: